@@ -17,7 +17,7 @@
 
 import unittest
 
-from pyspark.ml import Pipeline
+from pyspark.ml import Pipeline, PipelineModel
 from pyspark.ml.classification import LogisticRegression, OneVsRest
 from pyspark.ml.feature import VectorAssembler
 from pyspark.ml.linalg import Vectors
@@ -28,8 +28,8 @@ from pyspark.testing.mlutils import SparkSessionTestCase
 class MetaAlgorithmReadWriteTests(SparkSessionTestCase):
     def test_getAllNestedStages(self):
         def _check_uid_set_equal(stages, expected_stages):
-            uids = set(map(lambda x: x.uid, stages))
-            expected_uids = set(map(lambda x: x.uid, expected_stages))
+            uids = {stage.uid for stage in stages}
+            expected_uids = {stage.uid for stage in expected_stages}
             self.assertEqual(uids, expected_uids)
 
         df1 = self.spark.createDataFrame(
@@ -39,19 +39,14 @@ class MetaAlgorithmReadWriteTests(SparkSessionTestCase):
             ],
             ["features", "label"],
         )
-        df2 = self.spark.createDataFrame(
-            [
-                (1.0, 2.0, 1.0),
-                (1.0, 2.0, 0.0),
-            ],
-            ["a", "b", "label"],
-        )
         vs = VectorAssembler(inputCols=["a", "b"], outputCol="features")
         lr = LogisticRegression()
         pipeline = Pipeline(stages=[vs, lr])
-        pipelineModel = pipeline.fit(df2)
         ova = OneVsRest(classifier=lr)
         ovaModel = ova.fit(df1)
+        # getAllNestedStages only walks the stages, so reuse a fitted model from
+        # OneVsRest instead of training another LogisticRegression via pipeline.fit.
+        pipelineModel = PipelineModel(stages=[vs, ovaModel.models[0]])
 
         ova_pipeline = Pipeline(stages=[vs, ova])
         nested_pipeline = Pipeline(stages=[ova_pipeline])
@@ -14,7 +14,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import json
 from contextlib import contextmanager
 import collections
 import logging
@@ -230,6 +229,8 @@ class Distributor:
         return self.num_processes
 
     def _validate_input_params(self) -> None:
+        if isinstance(self.num_processes, bool):
+            raise TypeError("num_processes has to be an integer, not a bool")
         if self.num_processes <= 0:
             raise ValueError("num_proccesses has to be a positive integer")
 
@@ -357,6 +358,20 @@ class TorchDistributor(Distributor):
     _PICKLED_FUNC_FILE = "func.pickle"
     _TRAIN_FILE = "train.py"
     _PICKLED_OUTPUT_FILE = "output.pickle"
+    _TORCHRUN_PREFIX = (sys.executable, "-m", "pyspark.ml.torch.torch_run_process_wrapper")
+    _TRAIN_FILE_TEMPLATE = textwrap.dedent(
+        """
+        from pyspark import cloudpickle
+        import os
+
+        if __name__ == "__main__":
+            with open("{pickle_file_path}", "rb") as f:
+                train_fn, args, kwargs = cloudpickle.load(f)
+            output = train_fn(*args, **kwargs)
+            with open("{output_file_path}", "wb") as f:
+                cloudpickle.dump(output, f)
+        """
+    )
 
     def __init__(
         self,
@@ -385,6 +400,8 @@ class TorchDistributor(Distributor):
         ------
         ValueError
             If any of the parameters are incorrect.
+        TypeError
+            If num_processes is a bool.
         RuntimeError
             If an active SparkSession is unavailable.
         """
@@ -393,6 +410,34 @@ class TorchDistributor(Distributor):
         self._validate_input_params()
         self.input_params = self._create_input_params()
 
+    @staticmethod
+    def _get_torchrun_args(local_mode: bool, num_processes: int) -> Tuple[List[Any], int]:
+        """
+        Returns the torchrun launcher arguments and the number of processes per node.
+
+        In distributed mode the arguments depend on the "MASTER_ADDR", "MASTER_PORT"
+        and "RANK" environment variables that are set for the current Spark task,
+        so the result must not be cached across tasks.
+        """
+        if local_mode:
+            torchrun_args = ["--standalone", "--nnodes=1"]
+            processes_per_node = num_processes
+            return torchrun_args, processes_per_node
+
+        master_addr, master_port = (
+            os.environ["MASTER_ADDR"],
+            os.environ["MASTER_PORT"],
+        )
+        node_rank = os.environ["RANK"]
+        torchrun_args = [
+            f"--nnodes={num_processes}",
+            f"--node_rank={node_rank}",
+            f"--rdzv_endpoint={master_addr}:{master_port}",
+            "--rdzv_id=0",
+        ]  # TODO: setup random ID that is gleaned from env variables
+        processes_per_node = 1
+        return torchrun_args, processes_per_node
+
     @staticmethod
     def _create_torchrun_command(
         input_params: Dict[str, Any], path_to_train_file: str, *args: Any
@@ -400,33 +445,16 @@ class TorchDistributor(Distributor):
         local_mode = input_params["local_mode"]
         num_processes = input_params["num_processes"]
 
-        if local_mode:
-            torchrun_args = ["--standalone", "--nnodes=1"]
-            processes_per_node = num_processes
-        else:
-            master_addr, master_port = (
-                os.environ["MASTER_ADDR"],
-                os.environ["MASTER_PORT"],
-            )
-            node_rank = os.environ["RANK"]
-            torchrun_args = [
-                f"--nnodes={num_processes}",
-                f"--node_rank={node_rank}",
-                f"--rdzv_endpoint={master_addr}:{master_port}",
-                "--rdzv_id=0",
-            ]  # TODO: setup random ID that is gleaned from env variables
-            processes_per_node = 1
-
-        args_string = list(map(str, args))  # converting all args to strings
+        torchrun_args, processes_per_node = TorchDistributor._get_torchrun_args(
+            local_mode, num_processes
+        )
 
         return [
-            sys.executable,
-            "-m",
-            "pyspark.ml.torch.torch_run_process_wrapper",
+            *TorchDistributor._TORCHRUN_PREFIX,
             *torchrun_args,
             f"--nproc_per_node={processes_per_node}",
             path_to_train_file,
-            *args_string,
+            *map(str, args),  # converting all args to strings
         ]
 
     @staticmethod
@@ -823,18 +851,8 @@ class TorchDistributor(Distributor):
     def _create_torchrun_train_file(
         save_dir_path: str, pickle_file_path: str, output_file_path: str
     ) -> str:
-        code = textwrap.dedent(
-            f"""
-                    from pyspark import cloudpickle
-                    import os
-
-                    if __name__ == "__main__":
-                        with open("{pickle_file_path}", "rb") as f:
-                            train_fn, args, kwargs = cloudpickle.load(f)
-                        output = train_fn(*args, **kwargs)
-                        with open("{output_file_path}", "wb") as f:
-                            cloudpickle.dump(output, f)
-                    """
+        code = TorchDistributor._TRAIN_FILE_TEMPLATE.format(
+            pickle_file_path=pickle_file_path, output_file_path=output_file_path
         )
         saved_file_path = os.path.join(save_dir_path, TorchDistributor._TRAIN_FILE)
         with open(saved_file_path, "w") as f:
@@ -986,6 +1004,7 @@ def _get_spark_partition_data_loader(
     from pyspark.sql.types import StructType
     from pyspark.ml.torch.data import _SparkPartitionTorchDataset
     from torch.utils.data import DataLoader
+    import json
 
     arrow_file = os.environ[SPARK_PARTITION_ARROW_DATA_FILE]
     schema_file = os.environ[SPARK_DATAFRAME_SCHEMA_FILE]
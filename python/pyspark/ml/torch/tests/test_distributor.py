@@ -195,6 +195,7 @@ class TorchDistributorBaselineUnitTestsMixin:
     def test_validate_incorrect_inputs(self) -> None:
         inputs = [
             (0, False, False, ValueError, "positive"),
+            (True, False, False, TypeError, "not a bool"),
         ]
         for num_processes, local_mode, use_gpu, error, message in inputs:
             with self.subTest():